@@ -2,7 +2,10 @@
 # Complete each exercise by implementing the functions according to the requirements.
 # Refer to Error_Handling_and_Logging.md for concepts and best practices.
 
-from typing import Any, List, Union
+from array import array
+from bisect import bisect_left
+import heapq
+from typing import Any, Dict, List, Optional, Union
 
 # Exercise 1: Basic try/except
 # Problem: The following code crashes if division by zero occurs. 
@@ -59,14 +62,64 @@ users_dict = {
 }
 
 
-def get_user_name(users_dict: dict, user_id: int) -> Any:
-    username = users_dict[user_id]["name"]
+class UserTable:
+    """
+    Column-wise user registry: sorted user ids in a compact int64 array, with
+    names stored in a parallel list at the same index. Lookups are a binary
+    search over the ids instead of a hash probe into nested dicts.
+
+    The table is a snapshot of the dict it was built from; rebuild it after the
+    dict changes (e.g. once a user's data is stored).
+    """
+
+    def __init__(self, users: Dict[int, Optional[dict]]):
+        self.ids = array("q", sorted(users))
+        self.names = [None if users[uid] is None else users[uid]["name"] for uid in self.ids]
+
+    def _index(self, user_id: int) -> int:
+        idx = bisect_left(self.ids, user_id)
+        if idx == len(self.ids) or self.ids[idx] != user_id:
+            raise KeyError(f"User ID {user_id} is not registered.")
+        return idx
+
+    def get_name(self, user_id: int) -> str:
+        name = self.names[self._index(user_id)]
+        if name is None:
+            raise ValueError(f"User data for ID {user_id} has not been stored yet.")
+        return name
+
+    def get_names(self, user_ids: List[int]) -> List[str]:
+        """
+        Look up several names at once by sorting the queries and merging them
+        against the sorted ids in a single linear pass. Raises as get_name()
+        does, for the smallest bad ID.
+        """
+        names = [None] * len(user_ids)
+        pos = 0
+        for i in sorted(range(len(user_ids)), key=user_ids.__getitem__):
+            uid = user_ids[i]
+            while pos < len(self.ids) and self.ids[pos] < uid:
+                pos += 1
+            if pos == len(self.ids) or self.ids[pos] != uid:
+                raise KeyError(f"User ID {uid} is not registered.")
+            if self.names[pos] is None:
+                raise ValueError(f"User data for ID {uid} has not been stored yet.")
+            names[i] = self.names[pos]
+        return names
+
+
+# Built once from users_dict; rebuild with UserTable(users_dict) if it is updated
+user_table = UserTable(users_dict)
+
+
+def get_user_name(users: UserTable, user_id: int) -> Any:
+    username = users.get_name(user_id)
     return username
 
 test_cases = [(1111, "Alice"), (6767, None), (9999, None)]
 # for user_id in test_cases:
-#     result = get_user_name(users_dict, user_id[0])
-#     print(f"get_user_name(users_dict, {user_id[0]}) = {result}, expected = {user_id[1]}")
+#     result = get_user_name(user_table, user_id[0])
+#     print(f"get_user_name(user_table, {user_id[0]}) = {result}, expected = {user_id[1]}")
 
 
 # Exercise 5: Exception propagation
@@ -78,14 +131,17 @@ def parse_scores(input_str: str):
     Reads comma-separated scores and converts them to integers.
     Example input: 80,75,90
     """
-    scores = [int(x.strip()) for x in input_str.split(",")]  
+    # int() already ignores surrounding whitespace, so no per-token strip() is needed
+    scores = [int(x) for x in input_str.split(",")]
     return scores
 
 
 def compute_average(scores, n):
-    scores.sort(reverse = True)
-    selected = [scores[i] for i in range(n)]
-    avg = sum(selected) / len(selected) 
+    if n <= 0 or n > len(scores):
+        raise ValueError(f"n must be between 1 and {len(scores)}, got {n}")
+    # Select the top n with a bounded heap instead of sorting every score
+    selected = heapq.nlargest(n, scores)
+    avg = sum(selected) / n
     return avg
 
 
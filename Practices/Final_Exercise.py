@@ -2,41 +2,115 @@
 # Refactor this code to implement error handling and appropriate logging, ensuring that it logs appropriate error messages, returning None and closing the file when an error occurs instead of crashing.
 
 
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import List, Optional, Tuple
+import logging
+import mmap
 import os
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def validate_coords(coords: np.ndarray) -> int:
+    """
+    Check that every (x, y) point lies within [0, 1].
+
+    Returns the 1-based index of the first out-of-range (or NaN) point, or 0 if
+    all points are valid. The comparison runs as a single vectorized pass.
+    """
+    # min/max both return NaN if any value is NaN, which then fails the comparison
+    if coords.size == 0 or (coords.min() >= 0.0 and coords.max() <= 1.0):
+        return 0
+    # Written as a negated in-range test so NaN, which fails every comparison, is rejected
+    out_of_range = ~((coords >= 0.0) & (coords <= 1.0)).all(axis=1)
+    return int(np.argmax(out_of_range)) + 1
+
+
 def load_yolo_labels(
     txt_path: str,
-) -> List[Tuple[int, List[Tuple[float, float]]]]:
+) -> Optional[List[Tuple[int, np.ndarray]]]:
     """
     Load YOLO segmentation labels from file.
 
     Reads YOLO segmentation format labels where each line contains:
     class_id x1 y1 x2 y2 ... xn yn (normalized polygon coordinates which are each between 0 and 1)
 
-    Returns list of (class_id, polygon_points) tuples. Returns empty list if file
-    doesn't exist or is empty.
+    Returns list of (class_id, polygon_points) tuples, where polygon_points is a
+    float32 array of shape (n, 2). Returns empty list if file doesn't exist or
+    is empty, and None if a line has non-numerical data, a polygon has an odd
+    number of values or fewer than 3 points, or a coordinate is outside [0, 1].
     """
     labels = []
 
-    with open(txt_path, "r") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            parts = line.strip().split()
-            cls_id = int(parts[0])
-            coords = [
-                (float(parts[i]), float(parts[i + 1]))
-                for i in range(1, len(parts), 2)
-            ]
-            labels.append((cls_id, coords))
+    try:
+        fd = os.open(txt_path, os.O_RDONLY)
+    except FileNotFoundError:
+        logger.warning("Label file %s does not exist", txt_path)
+        return labels
+
+    try:
+        if os.fstat(fd).st_size == 0:
+            return labels
+        # Map the file as raw bytes so lines are split without a UTF-8 decode pass
+        with closing(mmap.mmap(fd, 0, access=mmap.ACCESS_READ)) as mm:
+            # splitlines() breaks on \n, \r and \r\n, as text-mode iteration does
+            line_numbers = []
+            for line_no, line in enumerate(mm.read().splitlines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    # Split on any whitespace after the class id, as str.split() does
+                    head, *rest = line.split(None, 1)
+                    cls_id = int(head)
+                    values = np.fromstring(rest[0] if rest else b"", sep=" ", dtype=np.float32)
+                except ValueError:
+                    logger.exception("Non-numerical data on line %d of %s", line_no, txt_path)
+                    return None
+                if values.size % 2:
+                    logger.error("Line %d of %s has an odd number of coordinate values", line_no, txt_path)
+                    return None
+                if values.size < 6:
+                    logger.error("Line %d of %s has fewer than 3 points", line_no, txt_path)
+                    return None
+                labels.append((cls_id, values.reshape(-1, 2)))
+                line_numbers.append(line_no)
+    finally:
+        os.close(fd)
+
+    if not labels:
+        return labels
+
+    # Range-check every point in the file with one vectorized pass
+    points = labels[0][1] if len(labels) == 1 else np.concatenate([coords for _, coords in labels])
+    bad_point = validate_coords(points)
+    if bad_point:
+        # Map the file-wide point index back to its label and the point within it
+        label_ends = np.cumsum([len(coords) for _, coords in labels])
+        label_idx = int(np.searchsorted(label_ends, bad_point - 1, side="right"))
+        point_idx = bad_point - 1 - (int(label_ends[label_idx - 1]) if label_idx else 0)
+        logger.error(
+            "Point %d of label %d (line %d) in %s is outside the range [0, 1]: %s",
+            point_idx + 1, label_idx + 1, line_numbers[label_idx], txt_path, points[bad_point - 1],
+        )
+        return None
+
+    logger.debug("Loaded %d labels from %s", len(labels), txt_path)
 
     return labels
 
 labels_dir = ".labels"
-for txt_path in os.listdir(labels_dir):
-    if txt_path.endswith(".txt"):
-        full_path = os.path.join(labels_dir, txt_path)
+label_paths = [entry.path for entry in os.scandir(labels_dir) if entry.name.endswith(".txt")]
+# Files are independent, so load them concurrently to overlap file I/O with parsing
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    futures = [executor.submit(load_yolo_labels, path) for path in label_paths]
+    for full_path, future in zip(label_paths, futures):
         print (f"Loading labels from {full_path}")
-        labels = load_yolo_labels(full_path)
+        # Collect each file's result separately so one bad file doesn't abort the rest
+        try:
+            labels = future.result()
+        except OSError:
+            logger.exception("Failed to load labels from %s", full_path)
+            continue
         print(f"Loaded labels: {labels}")
\ No newline at end of file
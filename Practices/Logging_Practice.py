@@ -4,9 +4,40 @@
 
 import logging
 import json
+from functools import lru_cache
+from numbers import Number
 import sys
 from typing import Any, List, Dict
 
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats each record as a single JSON object per line, so the log stream can
+    be ingested by Elasticsearch directly without a Logstash parsing step.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "lvl": record.levelname,
+            "msg": record.getMessage(),
+            "ts": record.created,
+            "mod": record.module,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+handler = logging.StreamHandler()
+handler.setFormatter(JSONFormatter())
+
+logging.basicConfig(
+    level=logging.INFO,
+    handlers=[handler]
+)
+
+logger = logging.getLogger(__name__)
+
 # Exercise 1: Basic logging setup
 # Problem: The function below uses print statements instead of logging. Refactor the function to use the logging module instead, and configure the logger to display messages at the INFO level
 
@@ -20,9 +51,9 @@ def extract_user_info(user_id: int) -> Dict[str, Any]:
     """
     Extract user information from the users_dict.
     """
-    print(f"Extracting user info for ID {user_id}")
+    logger.info("Extracting user info for ID %s", user_id)
     user_info = users_dict[user_id]
-    print(f"Extracted user info for ID {user_id}: {user_info}")
+    logger.info("Extracted user info for ID %s: %s", user_id, user_info)
     return user_info
     pass
 for user_id in users_dict.keys():
@@ -32,66 +63,97 @@ for user_id in users_dict.keys():
 # Exercise 2: Logging levels
 # Problem: The function below performs some operations and logs messages, but all at the same level. Refactor the function to use appropriate logging levels (DEBUG, INFO, WARNING, ERROR, CRITICAL) based on the context of each message.
 
-import logging
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s - %(message)s"
-)
-
-logger = logging.getLogger(__name__)
-
 def reciprocal(value):
-    logger.info(f"Processing value: {value}")
+    logger.debug("Processing value: %s", value)
 
     if not isinstance(value, (int, float)):
-        logger.info(f"Error: Value '{value}' is not a number.")
+        logger.info("Error: Value '%s' is not a number.", value)
         return None
 
     if value < 0:
-        logger.info(f"Negative value received: {value}, continuing.")
+        logger.info("Negative value received: %s, continuing.", value)
 
     if value == 0:
         logger.info("Error: Division by zero attempted.")
         return None
 
     result = 1 / value
-    logger.info(f"Successfully computed reciprocal of {value}: {result}")
+    logger.debug("Successfully computed reciprocal of %s: %s", value, result)
 
     return result
 
 
+def reciprocal_batch(values: List[Any]) -> List[Any]:
+    """
+    Compute the reciprocal of every value in one pass.
+
+    Non-numeric values and zeros map to None, as in reciprocal(), but are
+    reported in a single summary warning instead of one log call per element.
+    """
+    results = [
+        1 / value if isinstance(value, (int, float)) and value != 0 else None
+        for value in values
+    ]
+    num_invalid = results.count(None)
+    if num_invalid:
+        logger.warning("%d invalid of %d values", num_invalid, len(values))
+
+    return results
+
+
 numbers = [10, -5, 0, "hello", 25]
 
 for num in numbers:
     output = reciprocal(num)
     print(f"Reciprocal of {num}: {output}\n")
 
+print(f"Reciprocals of {numbers}: {reciprocal_batch(numbers)}\n")
+
 
 # Exercise 3: Logging exceptions with traceback
 # Problem: The function below all exceptions broadly but does not log the traceback, making it difficult to debug. Refactor the function to capture each exception and logging a message and a traceback of the corresponding exception when it occurs.
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s - %(message)s"
-)
+def safe_divide(a, b):
+    if not isinstance(a, (Number, str)) or not isinstance(b, (Number, str)):
+        logger.error("Cannot divide %r by %r: operands must be numbers or numeric strings.", a, b)
+        return None
 
-logger = logging.getLogger(__name__)
+    # Zeros are divided uncached: 0.0 and -0.0 (or Decimal("0") and Decimal("-0"))
+    # are equal keys, so a cached result would carry the wrong sign
+    if _is_zero(a) or _is_zero(b):
+        return _divide(a, b)
+    return _cached_divide(a, b)
 
 
-def safe_divide(a, b):
+def _is_zero(value) -> bool:
+    return isinstance(value, Number) and value == 0
+
+
+def _divide(a, b):
     try:
         numerator = float(a)
         denominator = float(b)
-        result = numerator / denominator
-        logger.info(f"Successfully computed division: {numerator} / {denominator} = {result}")
-        return result
+    except (ValueError, TypeError, OverflowError):
+        logger.exception("Could not convert %s or %s to a float.", a, b)
+        return None
 
-    except Exception:
-        logger.error(f"Error occurred while dividing {a} by {b}.")
+    try:
+        result = numerator / denominator
+    except ZeroDivisionError:
+        logger.exception("Division by zero attempted while dividing %s by %s.", a, b)
         return None
 
+    logger.info("Successfully computed division: %s / %s = %s", numerator, denominator, result)
+    return result
+
+
+# The operands are known to be hashable here, so repeated pairs (including
+# failing ones, cached as None) skip the conversion, division and logging.
+# typed=True keeps equal values of different types, such as 1, 1.0 and True,
+# in separate entries.
+_cached_divide = lru_cache(maxsize=4096, typed=True)(_divide)
+
 values = [(10, "2"), (5, 0), ("x", 3), (8, 4)]
 
 for a, b in values: